@@ -3,7 +3,8 @@ Deployment agent. Registers the champion model and its manifest.
 """
 from .base import Agent
 from typing import Dict, Any
-import pickle
+import asyncio
+import joblib
 import logging
 import os
 import datetime
@@ -11,6 +12,12 @@ from app.core.registry import register_model_champion
 
 logger = logging.getLogger(__name__)
 
+def _save_model(pipeline, model_path: str) -> None:
+    """Writes a model pipeline to disk. Blocking, so run it off the event loop."""
+    os.makedirs(os.path.dirname(model_path), exist_ok=True)
+    # joblib writes NumPy buffers in bulk; zlib level 3 shrinks forests cheaply
+    joblib.dump(pipeline, model_path, compress=("zlib", 3), protocol=5)
+
 class DeployFastAPIAgent(Agent):
     name = "DeployFastAPI"
     version = "1.0"
@@ -34,16 +41,14 @@ class DeployFastAPIAgent(Agent):
             "timestamp": datetime.datetime.now().isoformat(),
             "metrics": metrics,
             "genome": best_genome,
-            "model_path": f"./models/{run_id}.pkl"
+            "model_path": f"./models/{run_id}.joblib"
         }
 
-        # Save the model pipeline to disk
+        # Save the model pipeline to disk, keeping both writes off the event loop.
+        # The manifest is only registered once the artifact it points to exists.
         try:
-            os.makedirs("./models", exist_ok=True)
-            with open(model_manifest["model_path"], "wb") as f:
-                pickle.dump(champion_pipeline, f)
-
-            register_model_champion(model_manifest)
+            await asyncio.to_thread(_save_model, champion_pipeline, model_manifest["model_path"])
+            await asyncio.to_thread(register_model_champion, model_manifest)
 
             ctx["champion_model"] = model_manifest
             logger.info(f"Model {run_id} deployed and registered.")
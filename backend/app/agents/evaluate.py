@@ -4,7 +4,6 @@ Evaluation agent to calculate metrics on the champion model.
 from .base import Agent
 from typing import Dict, Any
 import logging
-from sklearn.metrics import roc_auc_score, f1_score, precision_recall_curve, auc
 import numpy as np
 
 logger = logging.getLogger(__name__)
@@ -17,6 +16,9 @@ class EvaluateAgent(Agent):
         """
         Evaluates the champion model on the test set and calculates key metrics.
         """
+        # Deferred so that importing the agent does not load sklearn.metrics
+        from sklearn.metrics import roc_auc_score, precision_recall_curve, auc
+
         champion_pipeline = ctx.get("champion_pipeline")
         X_test = ctx.get("X_test")
         y_test = ctx.get("y_test")
@@ -25,23 +27,27 @@ class EvaluateAgent(Agent):
             raise ValueError("Missing required context for evaluation.")
 
         try:
-            # Predict probabilities
-            y_pred_proba = champion_pipeline.predict_proba(X_test)[:, 1]
+            # X_test is already preprocessed, so predict with the classifier step only
+            y_pred_proba = champion_pipeline.named_steps["classifier"].predict_proba(X_test)[:, 1]
 
             # Calculate metrics
             roc_auc = roc_auc_score(y_test, y_pred_proba)
 
-            precision, recall, _ = precision_recall_curve(y_test, y_pred_proba)
+            precision, recall, thresholds = precision_recall_curve(y_test, y_pred_proba)
             pr_auc = auc(recall, precision)
 
-            # For F1 score, we need to choose a threshold. Using 0.5 for simplicity.
-            y_pred = (y_pred_proba > 0.5).astype(int)
-            f1 = f1_score(y_test, y_pred)
+            # Pick the F1-optimal threshold from the PR curve in one vectorized pass.
+            # The last PR point (recall 0) has no threshold, so it is excluded.
+            f1s = 2 * precision[:-1] * recall[:-1] / (precision[:-1] + recall[:-1] + 1e-12)
+            best_idx = np.argmax(f1s)
+            f1 = f1s[best_idx]
+            best_threshold = thresholds[best_idx]
 
             metrics = {
                 "roc_auc": float(roc_auc),
                 "pr_auc": float(pr_auc),
-                "f1_score": float(f1)
+                "f1_score": float(f1),
+                "f1_threshold": float(best_threshold)
             }
 
             ctx["metrics"] = metrics
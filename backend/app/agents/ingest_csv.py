@@ -16,7 +16,8 @@ class IngestCSVAgent(Agent):
     async def run(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """
         Reads a CSV file from a specified path in the context and returns
-        the data as a Pandas DataFrame.
+        the data as a Pandas DataFrame. Columns can be restricted with
+        ctx["usecols"], and a known ctx["schema"] skips dtype inference.
         """
         dataset_id = ctx.get("dataset_id")
         if not dataset_id:
@@ -27,8 +28,21 @@ class IngestCSVAgent(Agent):
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"Dataset file not found at {file_path}")
 
+        read_kwargs = {}
+        usecols = ctx.get("usecols")
+        if usecols:
+            target = ctx.get("target")
+            read_kwargs["usecols"] = list(usecols) + ([target] if target and target not in usecols else [])
+        schema = ctx.get("schema")
+        if schema:
+            read_kwargs["dtype"] = schema
+
         try:
-            df = pd.read_csv(file_path)
+            try:
+                # The pyarrow engine parses multithreaded
+                df = pd.read_csv(file_path, engine="pyarrow", **read_kwargs)
+            except ImportError:
+                df = pd.read_csv(file_path, **read_kwargs)
             logger.info(f"Ingested CSV file from {file_path}")
             ctx["dataframe"] = df
             ctx["schema"] = df.dtypes.astype(str).to_dict()
@@ -4,14 +4,13 @@ Data preprocessing agent.
 from .base import Agent
 from typing import Dict, Any
 import pandas as pd
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sklearn.pipeline import Pipeline
-from sklearn.compose import ColumnTransformer
+import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
+TEST_SIZE = 0.2
+
 class PrepBasicAgent(Agent):
     name = "PrepBasic"
     version = "1.0"
@@ -19,8 +18,13 @@ class PrepBasicAgent(Agent):
     async def run(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """
         Performs basic data preprocessing: splits data into train/test,
-        and creates a preprocessing pipeline for numerical columns.
+        fits a preprocessing pipeline for numerical columns and stores
+        the transformed splits as float32 arrays.
         """
+        # Lazy import: sklearn is only loaded once a run reaches preprocessing
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.compose import ColumnTransformer
+
         df = ctx.get("dataframe")
         if df is None:
             raise ValueError("DataFrame not found in context.")
@@ -38,6 +42,17 @@ class PrepBasicAgent(Agent):
         # Identify numerical features. For this MVP, we only handle numerical.
         numerical_features = X.select_dtypes(include=['int64', 'float64']).columns
 
+        # Down-cast to 32-bit to halve memory traffic through scaling and model fits
+        float_features = X[numerical_features].select_dtypes(include='float64').columns
+        X[float_features] = X[float_features].astype(np.float32)
+        int32_info = np.iinfo(np.int32)
+        for col in X[numerical_features].select_dtypes(include='int64').columns:
+            if int32_info.min <= X[col].min() and X[col].max() <= int32_info.max:
+                X[col] = X[col].astype(np.int32)
+
+        if pd.api.types.is_integer_dtype(y) and y.nunique() == 2 and y.min() >= 0 and y.max() <= 1:
+            y = y.astype(np.int8)
+
         # Create a preprocessing pipeline
         preprocessor = ColumnTransformer(
             transformers=[
@@ -46,10 +61,41 @@ class PrepBasicAgent(Agent):
             remainder='passthrough'
         )
 
-        X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42, stratify=y)
+        # Stratified train/test split in plain NumPy, allocating test rows per
+        # class the way sklearn's train_test_split(stratify=y) does: the total is
+        # rounded up, each class gets its proportional floor, and the remainder
+        # goes to the classes with the largest fractional shares.
+        y_values = y.to_numpy()
+        _, y_codes, class_counts = np.unique(y_values, return_inverse=True, return_counts=True)
+        n_test = int(np.ceil(TEST_SIZE * len(y_values)))
+        exact = class_counts * n_test / len(y_values)
+        n_test_per_class = np.floor(exact).astype(int)
+        remainder = n_test - n_test_per_class.sum()
+        n_test_per_class[np.argsort(exact - n_test_per_class, kind="stable")[::-1][:remainder]] += 1
+        # Any class with at least 2 rows keeps at least one row in each split
+        n_test_per_class[(n_test_per_class == 0) & (class_counts >= 2)] = 1
+        n_test_per_class = np.minimum(n_test_per_class, np.maximum(class_counts - 1, 0))
+
+        rng = np.random.default_rng(42)
+        test_parts = []
+        for code, class_n_test in enumerate(n_test_per_class):
+            class_idx = np.flatnonzero(y_codes == code)
+            rng.shuffle(class_idx)
+            test_parts.append(class_idx[:class_n_test])
+        test_idx = np.concatenate(test_parts)
+        train_idx = np.setdiff1d(np.arange(len(y_values)), test_idx, assume_unique=True)
+        # Interleave the classes instead of leaving rows grouped by label
+        rng.shuffle(test_idx)
+        rng.shuffle(train_idx)
+
+        X_train, X_test = X.iloc[train_idx], X.iloc[test_idx]
+        y_train, y_test = y_values[train_idx], y_values[test_idx]
 
-        ctx["X_train"] = X_train
-        ctx["X_test"] = X_test
+        # Transform once into C-contiguous float32 arrays so every later fit,
+        # CV fold and prediction skips both the transformer and the
+        # DataFrame-to-ndarray conversion.
+        ctx["X_train"] = np.ascontiguousarray(preprocessor.fit_transform(X_train), dtype=np.float32)
+        ctx["X_test"] = np.ascontiguousarray(preprocessor.transform(X_test), dtype=np.float32)
         ctx["y_train"] = y_train
         ctx["y_test"] = y_test
         ctx["preprocessor"] = preprocessor
@@ -5,47 +5,201 @@ to find the best model architecture and hyperparameters.
 from .base import Agent
 from typing import Dict, Any
 import asyncio
+import hashlib
+import heapq
 import logging
 import json
-import random
-from sklearn.linear_model import LogisticRegression
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import cross_val_score
-from sklearn.pipeline import Pipeline
+import os
+import orjson
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+import joblib
 import numpy as np
+from cachetools import LRUCache
+from numba import njit, prange
 from app.core.telemetry import LiveTelemetryManager
 
 logger = logging.getLogger(__name__)
 
-# Mock model genomes for simplicity
-def get_genome():
-    """Generates a random model genome."""
-    models = ["logistic_regression", "random_forest"]
-    model_choice = random.choice(models)
+CV_FOLDS = 5
+# Cheap first-round CV used to prune weak genomes before the full CV_FOLDS run
+SCREEN_FOLDS = 2
 
-    if model_choice == "logistic_regression":
+# Mean CV score per (dataset, training data, genome, fold count), shared across
+# runs. Bounded so it cannot grow for the life of the process.
+_SCORE_CACHE: LRUCache = LRUCache(maxsize=4096)
+
+# Genome search space. Categorical genes are stored as indices into these tuples.
+MODELS = ("logistic_regression", "random_forest")
+SOLVERS = ("liblinear", "lbfgs")
+N_MODELS, N_SOLVERS = len(MODELS), len(SOLVERS)
+C_MIN, C_MAX = 0.1, 10.0
+N_ESTIMATORS_MIN, N_ESTIMATORS_MAX = 50, 200
+MAX_DEPTH_MIN, MAX_DEPTH_MAX = 5, 20
+
+POPULATION_SIZE = 8
+TOURNAMENT_SIZE = 3
+MUTATION_RATE = 0.3
+# Attempts to mutate a clone into an unseen genome before giving up on it
+MAX_REMUTATIONS = 20
+
+def random_population(size: int) -> Dict[str, np.ndarray]:
+    """
+    Samples a random population as a structure of arrays: one column per gene,
+    one row per individual. Every individual carries all genes; only those of
+    its model are expressed, the rest are kept so mutation can switch models.
+    """
+    rng = np.random.default_rng()
+    return {
+        "model_id": rng.integers(0, N_MODELS, size).astype(np.int8),
+        "C": rng.uniform(C_MIN, C_MAX, size).astype(np.float32),
+        "solver_id": rng.integers(0, N_SOLVERS, size).astype(np.int8),
+        "n_estimators": rng.integers(N_ESTIMATORS_MIN, N_ESTIMATORS_MAX + 1, size).astype(np.int16),
+        "max_depth": rng.integers(MAX_DEPTH_MIN, MAX_DEPTH_MAX + 1, size).astype(np.int8),
+        "score": np.zeros(size, dtype=np.float32),
+    }
+
+def genome_from_row(population: Dict[str, np.ndarray], i: int) -> Dict[str, Any]:
+    """Decodes one individual of the population into a model genome."""
+    model = MODELS[population["model_id"][i]]
+    if model == "logistic_regression":
         return {
-            "model": "logistic_regression",
+            "model": model,
             "params": {
-                "C": random.uniform(0.1, 10.0),
-                "solver": random.choice(["liblinear", "lbfgs"])
+                # Rounded to 3 significant figures so near-identical genomes share a cache entry
+                "C": float(f"{population['C'][i]:.3g}"),
+                "solver": SOLVERS[population["solver_id"][i]]
             }
         }
-    elif model_choice == "random_forest":
-        return {
-            "model": "random_forest",
-            "params": {
-                "n_estimators": random.randint(50, 200),
-                "max_depth": random.randint(5, 20)
-            }
+    return {
+        "model": model,
+        "params": {
+            "n_estimators": int(population["n_estimators"][i]),
+            "max_depth": int(population["max_depth"][i])
         }
+    }
+
+@njit(parallel=True, cache=True)
+def tournament_select(scores, k):
+    """Picks one parent per individual, each the best of k random contenders."""
+    n = scores.shape[0]
+    parents = np.empty(n, dtype=np.int64)
+    for i in prange(n):
+        best = np.random.randint(0, n)
+        for _ in range(k - 1):
+            contender = np.random.randint(0, n)
+            if scores[contender] > scores[best]:
+                best = contender
+        parents[i] = best
+    return parents
+
+@njit(cache=True)
+def mutate(model_id, C, solver_id, n_estimators, max_depth, rate):
+    """
+    Mutates a population in place. Categorical genes are resampled,
+    numerical genes are perturbed and clipped to their bounds.
+    """
+    for i in range(model_id.shape[0]):
+        if np.random.random() < rate:
+            model_id[i] = np.random.randint(0, N_MODELS)
+        if np.random.random() < rate:
+            C[i] = min(max(C[i] * np.exp(np.random.normal(0.0, 0.5)), C_MIN), C_MAX)
+        if np.random.random() < rate:
+            solver_id[i] = np.random.randint(0, N_SOLVERS)
+        if np.random.random() < rate:
+            n_estimators[i] = min(max(n_estimators[i] + np.random.randint(-25, 26), N_ESTIMATORS_MIN), N_ESTIMATORS_MAX)
+        if np.random.random() < rate:
+            max_depth[i] = min(max(max_depth[i] + np.random.randint(-3, 4), MAX_DEPTH_MIN), MAX_DEPTH_MAX)
+
+def next_generation(population: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """Breeds a new population from a scored one by tournament selection and mutation."""
+    parents = tournament_select(population["score"], TOURNAMENT_SIZE)
+    children = {gene: column[parents] for gene, column in population.items()}
+    children["score"][:] = 0.0
+    mutate(
+        children["model_id"], children["C"], children["solver_id"],
+        children["n_estimators"], children["max_depth"], MUTATION_RATE
+    )
+    return children
+
+def remutate_duplicates(population: Dict[str, np.ndarray], seen: set) -> None:
+    """
+    Re-mutates individuals whose expressed genome was already evaluated, or
+    appears earlier in the same population, so no trial budget is spent on
+    clones. seen holds canonical genome strings and is updated in place.
+    """
+    for row in range(population["model_id"].shape[0]):
+        key = json.dumps(genome_from_row(population, row), sort_keys=True)
+        attempts = 0
+        while key in seen and attempts < MAX_REMUTATIONS:
+            mutate(
+                population["model_id"][row:row + 1], population["C"][row:row + 1],
+                population["solver_id"][row:row + 1], population["n_estimators"][row:row + 1],
+                population["max_depth"][row:row + 1], MUTATION_RATE
+            )
+            key = json.dumps(genome_from_row(population, row), sort_keys=True)
+            attempts += 1
+        seen.add(key)
+
+# Compile the kernels at import so the first run does not pay for JIT warmup
+remutate_duplicates(next_generation(random_population(2)), set())
+
+# sklearn estimators, imported on first use to keep sklearn out of process start-up
+_LR = None
+_RF = None
+
+def _get_lr():
+    global _LR
+    if _LR is None:
+        from sklearn.linear_model import LogisticRegression
+        _LR = LogisticRegression
+    return _LR
+
+def _get_rf():
+    global _RF
+    if _RF is None:
+        from sklearn.ensemble import RandomForestClassifier
+        _RF = RandomForestClassifier
+    return _RF
 
 def build_model_from_genome(genome):
     """Builds a scikit-learn model from a genome."""
     if genome["model"] == "logistic_regression":
-        return LogisticRegression(**genome["params"])
+        return _get_lr()(**genome["params"])
     elif genome["model"] == "random_forest":
-        return RandomForestClassifier(**genome["params"])
+        return _get_rf()(**genome["params"], n_jobs=-1)
+
+def data_fingerprint(X_train, y_train) -> str:
+    """Hashes the training data so cached scores never outlive a dataset's contents."""
+    digest = hashlib.blake2b()
+    for array in (X_train, y_train):
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype}{array.shape}".encode())
+        # Object arrays (e.g. string labels) expose no raw buffer to hash
+        digest.update(repr(array.tolist()).encode() if array.dtype == object else array)
+    return digest.hexdigest()
+
+def genome_key(genome, dataset_id, target, fingerprint, cv=CV_FOLDS) -> str:
+    """Builds a content-addressed cache key for a genome's CV score on a given dataset."""
+    payload = json.dumps(
+        {"dataset_id": dataset_id, "target": target, "data": fingerprint, "genome": genome, "cv": cv},
+        sort_keys=True, default=str
+    )
+    return hashlib.blake2b(payload.encode()).hexdigest()
+
+def score_model(model, X_train, y_train, cv=CV_FOLDS) -> float:
+    """
+    Cross-validates a model on preprocessed data and returns its mean ROC AUC.
+    cv is a fold count or precomputed (train, test) index pairs.
+    The folds are fitted in parallel across all cores.
+    """
+    from sklearn.model_selection import cross_val_score
+
+    scores = cross_val_score(
+        model, X_train, y_train, cv=cv, scoring="roc_auc", n_jobs=-1, pre_dispatch="2*n_jobs"
+    )
+    return float(np.mean(scores))
 
 class EvolveSearchAgent(Agent):
     name = "EvolveSearch"
@@ -53,12 +207,17 @@ class EvolveSearchAgent(Agent):
 
     async def run(self, ctx: Dict[str, Any]) -> Dict[str, Any]:
         """
-        Executes a simplified evolutionary search.
-        For a more advanced version, this would be a full genetic algorithm loop.
+        Executes an evolutionary search: a random initial population is bred
+        by tournament selection and mutation until the trial budget is spent.
         """
+        from sklearn.model_selection import StratifiedKFold
+        from sklearn.pipeline import Pipeline
+
         X_train = ctx.get("X_train")
         y_train = ctx.get("y_train")
         preprocessor = ctx.get("preprocessor")
+        dataset_id = ctx.get("dataset_id")
+        target = ctx.get("target")
         run_id = ctx.get("run_id")
         budget = ctx.get("budget", 10)
         telemetry_manager: LiveTelemetryManager = ctx.get("telemetry_manager")
@@ -69,41 +228,121 @@ class EvolveSearchAgent(Agent):
         best_score = -1.0
         best_genome = None
 
-        # Simulate an evolutionary process
-        for i in range(budget):
-            await asyncio.sleep(0.5) # Simulate work
-            genome = get_genome()
-            model = build_model_from_genome(genome)
-
-            # Create a full pipeline with preprocessing
-            pipeline = Pipeline(steps=[('preprocessor', preprocessor), ('classifier', model)])
-
-            try:
-                scores = cross_val_score(pipeline, X_train, y_train, cv=5, scoring="roc_auc")
-                mean_score = np.mean(scores)
-            except Exception as e:
-                logger.warning(f"Trial {i} failed: {e}")
-                mean_score = 0.0
-
-            # Send live trial telemetry
-            trial_data = {
-                "run_id": run_id,
-                "trial_id": i,
-                "model_type": genome["model"],
-                "score": float(mean_score),
-                "params": genome["params"],
-                "status": "completed" if mean_score > 0 else "failed"
+        loop = asyncio.get_running_loop()
+        # Each trial already spreads its folds over CV_FOLDS cores, so only run
+        # as many trials at once as it takes to fill the machine.
+        concurrency = max(1, min(budget, (os.cpu_count() or 1) // CV_FOLDS))
+        semaphore = asyncio.Semaphore(concurrency)
+
+        # Cached scores are only reused for byte-identical training data
+        fingerprint = data_fingerprint(X_train, y_train)
+
+        # Successive halving: every genome is screened with SCREEN_FOLDS, and only
+        # those beating the weakest of the top screening scores get the full CV.
+        screen_heap = []
+        n_survivors = max(1, budget // 4)
+
+        async def cross_validate(genome: Dict[str, Any], cv: int, pool: ThreadPoolExecutor) -> float:
+            key = genome_key(genome, dataset_id, target, fingerprint, cv)
+            score = _SCORE_CACHE.get(key)
+            if score is None:
+                # X_train is already preprocessed, so trials fit the bare classifier
+                model = build_model_from_genome(genome)
+                score = await loop.run_in_executor(
+                    pool, score_model, model, X_train, y_train, cv_splits[cv]
+                )
+                _SCORE_CACHE[key] = score
+            return score
+
+        async def eval_trial(i: int, row: int, genome: Dict[str, Any], pool: ThreadPoolExecutor):
+            async with semaphore:
+                try:
+                    screen_score = await cross_validate(genome, SCREEN_FOLDS, pool)
+                    if len(screen_heap) < n_survivors:
+                        heapq.heappush(screen_heap, screen_score)
+                        survives = True
+                    elif screen_score > screen_heap[0]:
+                        heapq.heapreplace(screen_heap, screen_score)
+                        survives = True
+                    else:
+                        survives = False
+
+                    if survives:
+                        mean_score = await cross_validate(genome, CV_FOLDS, pool)
+                        status = "completed" if mean_score > 0 else "failed"
+                    else:
+                        mean_score = screen_score
+                        status = "pruned"
+                except Exception as e:
+                    logger.warning(f"Trial {i} failed: {e}")
+                    mean_score = 0.0
+                    status = "failed"
+
+                # Send live trial telemetry as soon as this trial finishes
+                trial_data = {
+                    "run_id": run_id,
+                    "trial_id": i,
+                    "model_type": genome["model"],
+                    "score": float(mean_score),
+                    "params": genome["params"],
+                    "status": status
+                }
+                await telemetry_manager.send_message(orjson.dumps({"type": "trial_update", "data": trial_data}))
+                return row, genome, mean_score, status
+
+        # Evolve generation by generation until the trial budget is spent.
+        # Trials within a generation are evaluated concurrently, bounded to
+        # avoid oversubscribing cores.
+        population = random_population(POPULATION_SIZE)
+        seen_genomes = set()
+        n_trials = 0
+
+        # Back X_train with a memory-mapped file once per run. joblib passes
+        # memmaps to its CV worker processes by reference, so they all read the
+        # same pages instead of each trial re-serializing the whole matrix.
+        # Everything after mkdtemp runs inside the try so the copy is always removed.
+        mmap_dir = tempfile.mkdtemp(prefix="neurogenx-mmap-")
+        try:
+            mmap_path = os.path.join(mmap_dir, "X_train.mmap")
+            joblib.dump(X_train, mmap_path)
+            X_train = joblib.load(mmap_path, mmap_mode="r")
+
+            # Compute the fold indices once and share them across all trials
+            cv_splits = {
+                folds: list(StratifiedKFold(n_splits=folds, shuffle=True, random_state=42).split(X_train, y_train))
+                for folds in (SCREEN_FOLDS, CV_FOLDS)
             }
-            await telemetry_manager.send_message(json.dumps({"type": "trial_update", "data": trial_data}))
 
-            if mean_score > best_score:
-                best_score = mean_score
-                best_genome = genome
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                while n_trials < budget:
+                    remutate_duplicates(population, seen_genomes)
+                    generation_size = min(POPULATION_SIZE, budget - n_trials)
+                    trials = [
+                        eval_trial(n_trials + row, row, genome_from_row(population, row), pool)
+                        for row in range(generation_size)
+                    ]
+                    n_trials += generation_size
+
+                    for trial in asyncio.as_completed(trials):
+                        row, genome, mean_score, status = await trial
+                        population["score"][row] = mean_score
+                        # Pruned scores come from fewer folds, so only fully evaluated
+                        # genomes compete for champion
+                        if status != "pruned" and mean_score > best_score:
+                            best_score = mean_score
+                            best_genome = genome
+
+                    if n_trials < budget:
+                        population = next_generation(population)
+
+            # Train the champion model on the full training data, then pair it with
+            # the already fitted preprocessor so the deployed pipeline takes raw data
+            champion_model = build_model_from_genome(best_genome)
+            champion_model.fit(X_train, y_train)
+        finally:
+            shutil.rmtree(mmap_dir, ignore_errors=True)
 
-        # Train the champion model on the full training data
-        champion_model = build_model_from_genome(best_genome)
         champion_pipeline = Pipeline(steps=[('preprocessor', preprocessor), ('classifier', champion_model)])
-        champion_pipeline.fit(X_train, y_train)
 
         ctx["champion_pipeline"] = champion_pipeline
         ctx["champion_genome"] = best_genome
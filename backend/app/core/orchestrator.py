@@ -4,21 +4,58 @@ It manages the entire lifecycle of a model run, from data ingestion
 to deployment, by coordinating the various agents.
 """
 from typing import Dict, Any, Union
-import json
+import copy
 import logging
 import asyncio
 import uuid
 import os
+from collections import deque
+import orjson
+from cachetools import TTLCache
 from .registry import register_model_champion, get_champion_manifest
 from .telemetry import LiveTelemetryManager
 from app.agents import ingest_csv, prep_basic, search_evolve, evaluate, deploy_fastapi
 from pydantic import BaseModel
 
-# In-memory store for run statuses
-RUN_STATUS: Dict[str, Any] = {}
+# In-memory store for run statuses. Bounded in size and age so finished
+# runs are eventually evicted instead of accumulating for the process lifetime.
+RUN_STATUS: TTLCache = TTLCache(maxsize=1024, ttl=86400)
+RUN_LOG_MAXLEN = 200
+# Status of runs still in progress. Holds them independently of RUN_STATUS so
+# an in-flight run survives cache eviction.
+_ACTIVE_RUNS: Dict[str, Dict[str, Any]] = {}
+# Last status broadcast per run, used to send only what changed since
+_LAST_SENT: Dict[str, Dict[str, Any]] = {}
 telemetry_manager = LiveTelemetryManager()
 logger = logging.getLogger(__name__)
 
+def _json_default(obj: Any) -> Any:
+    """Serializes types orjson does not handle natively."""
+    if isinstance(obj, deque):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+async def _update_status(run_id: str, **changes: Any) -> None:
+    """
+    Applies changes to a run's status and broadcasts them via WebSocket.
+    Only the fields that differ from the last broadcast are sent, as a
+    {"run_id", "patch"} message; nothing is sent if nothing changed.
+    """
+    status = _ACTIVE_RUNS.get(run_id) or RUN_STATUS.get(run_id)
+    if status is None:
+        return
+    # Re-insert in case RUN_STATUS evicted the run while it was in progress
+    RUN_STATUS[run_id] = status
+    status.update(changes)
+    last_sent = _LAST_SENT.get(run_id, {})
+    patch = {k: v for k, v in status.items() if k not in last_sent or last_sent[k] != v}
+    if not patch:
+        return
+    _LAST_SENT[run_id] = copy.deepcopy(status)
+    await telemetry_manager.send_message(
+        orjson.dumps({"run_id": run_id, "patch": patch}, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
+    )
+
 class RunRequest(BaseModel):
     """Pydantic model for a run request."""
     dataset_id: str
@@ -32,38 +69,34 @@ async def start_run(request: RunRequest):
     """
     run_id = str(uuid.uuid4())
     logger.info(f"Starting new run with ID: {run_id}")
-    RUN_STATUS[run_id] = {
+    RUN_STATUS[run_id] = _ACTIVE_RUNS[run_id] = {
         "status": "pending",
         "progress": 0,
         "run_id": run_id,
-        "log": []
+        "log": deque(maxlen=RUN_LOG_MAXLEN)
     }
 
-    # Send initial status via WebSocket
-    await telemetry_manager.send_message(json.dumps(RUN_STATUS[run_id]))
-
     try:
+        # Send initial status via WebSocket
+        await _update_status(run_id)
+
         # Step 1: Ingest Data
-        RUN_STATUS[run_id]["status"] = "ingesting data"
-        RUN_STATUS[run_id]["progress"] = 10
-        await telemetry_manager.send_message(json.dumps(RUN_STATUS[run_id]))
+        await _update_status(run_id, status="ingesting data", progress=10)
         ctx = await ingest_csv.IngestCSVAgent().run(ctx={"dataset_id": request.dataset_id, "target": request.target})
 
         # Step 2: Preprocess Data
-        RUN_STATUS[run_id]["status"] = "preprocessing data"
-        RUN_STATUS[run_id]["progress"] = 25
-        await telemetry_manager.send_message(json.dumps(RUN_STATUS[run_id]))
+        await _update_status(run_id, status="preprocessing data", progress=25)
         ctx = await prep_basic.PrepBasicAgent().run(ctx=ctx)
 
         # Step 3: Evolve Model (Genetic Search)
-        RUN_STATUS[run_id]["status"] = "evolving model"
-        RUN_STATUS[run_id]["progress"] = 50
-        await telemetry_manager.send_message(json.dumps(RUN_STATUS[run_id]))
+        await _update_status(run_id, status="evolving model", progress=50)
         # The search agent will update telemetry live via its own method
         ctx = await search_evolve.EvolveSearchAgent().run(
             ctx={
                 "X_train": ctx["X_train"],
                 "y_train": ctx["y_train"],
+                "dataset_id": request.dataset_id,
+                "target": request.target,
                 "budget": request.run_budget,
                 "run_id": run_id,
                 "telemetry_manager": telemetry_manager,
@@ -72,36 +105,37 @@ async def start_run(request: RunRequest):
         )
 
         # Step 4: Evaluate Champion
-        RUN_STATUS[run_id]["status"] = "evaluating champion"
-        RUN_STATUS[run_id]["progress"] = 80
-        await telemetry_manager.send_message(json.dumps(RUN_STATUS[run_id]))
+        await _update_status(run_id, status="evaluating champion", progress=80)
         ctx = await evaluate.EvaluateAgent().run(ctx=ctx)
 
         # Step 5: Deploy Champion
-        RUN_STATUS[run_id]["status"] = "deploying"
-        RUN_STATUS[run_id]["progress"] = 95
-        await telemetry_manager.send_message(json.dumps(RUN_STATUS[run_id]))
+        await _update_status(run_id, status="deploying", progress=95)
         ctx = await deploy_fastapi.DeployFastAPIAgent().run(ctx=ctx)
 
         # Finalize status
-        RUN_STATUS[run_id]["status"] = "completed"
-        RUN_STATUS[run_id]["progress"] = 100
-        RUN_STATUS[run_id]["champion_model"] = ctx.get("champion_model")
-        RUN_STATUS[run_id]["metrics"] = ctx.get("metrics")
-        await telemetry_manager.send_message(json.dumps(RUN_STATUS[run_id]))
+        await _update_status(
+            run_id,
+            status="completed",
+            progress=100,
+            # Only the artifact path is kept; the full manifest is available
+            # from the registry via get_champion_manifest()
+            champion_model=ctx["champion_model"]["model_path"],
+            metrics=ctx.get("metrics")
+        )
 
         logger.info(f"Run {run_id} completed successfully.")
 
     except Exception as e:
         logger.error(f"Run {run_id} failed: {e}")
-        RUN_STATUS[run_id]["status"] = "failed"
-        RUN_STATUS[run_id]["error"] = str(e)
-        await telemetry_manager.send_message(json.dumps(RUN_STATUS[run_id]))
+        await _update_status(run_id, status="failed", error=str(e))
+    finally:
+        _ACTIVE_RUNS.pop(run_id, None)
+        _LAST_SENT.pop(run_id, None)
 
 def get_status(run_id: str) -> Dict[str, Any]:
     """Retrieves the current status of a run."""
-    return RUN_STATUS.get(run_id, {"status": "not found"})
+    return _ACTIVE_RUNS.get(run_id) or RUN_STATUS.get(run_id, {"status": "not found"})
 
-def load_champion_model() -> Union[Dict[str, Any], None]:
+async def load_champion_model() -> Union[Dict[str, Any], None]:
     """Loads the currently deployed champion model manifest."""
-    return get_champion_manifest()
+    return await asyncio.to_thread(get_champion_manifest)
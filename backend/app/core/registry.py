@@ -3,7 +3,7 @@ Handles the model registry. This is where trained models and their
 metadata (manifests) are stored and versioned.
 """
 import os
-import json
+import orjson
 import logging
 from typing import Dict, Any, Union
 
@@ -20,8 +20,11 @@ def register_model_champion(model_manifest: Dict[str, Any]) -> None:
     """
     os.makedirs(MODELS_DIR, exist_ok=True)
     try:
-        with open(CHAMPION_MANIFEST_PATH, "w") as f:
-            json.dump(model_manifest, f, indent=4)
+        with open(CHAMPION_MANIFEST_PATH, "wb") as f:
+            f.write(orjson.dumps(
+                model_manifest,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            ))
         logger.info(f"New champion model registered and saved to {CHAMPION_MANIFEST_PATH}")
     except IOError as e:
         logger.error(f"Failed to write champion manifest: {e}")
@@ -36,9 +39,9 @@ def get_champion_manifest() -> Union[Dict[str, Any], None]:
         return None
 
     try:
-        with open(CHAMPION_MANIFEST_PATH, "r") as f:
-            manifest = json.load(f)
+        with open(CHAMPION_MANIFEST_PATH, "rb") as f:
+            manifest = orjson.loads(f.read())
         return manifest
-    except (IOError, json.JSONDecodeError) as e:
+    except (IOError, orjson.JSONDecodeError) as e:
         logger.error(f"Failed to read or parse champion manifest: {e}")
         return None
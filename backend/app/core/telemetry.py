@@ -4,9 +4,8 @@ This allows the frontend to receive live updates from the backend
 about the progress of a model evolution run.
 """
 import asyncio
-import json
-from fastapi import WebSocket
-from typing import List
+from fastapi import WebSocket, WebSocketDisconnect
+from typing import Set, Union
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,36 +15,36 @@ class LiveTelemetryManager:
     A singleton-like class to manage WebSocket connections and send messages.
     """
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         """Accepts a new WebSocket connection."""
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
         logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
 
     def disconnect(self, websocket: WebSocket):
         """Removes a WebSocket connection."""
-        try:
-            self.active_connections.remove(websocket)
+        if websocket in self.active_connections:
+            self.active_connections.discard(websocket)
             logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
-        except ValueError:
-            pass # Connection already removed
 
-    async def send_message(self, message: str):
+    async def send_message(self, message: Union[str, bytes]):
         """
         Broadcasts a message to all active WebSocket connections.
-        Handles disconnection gracefully.
+        The message is encoded once (if not already bytes) and fanned out
+        concurrently. Handles disconnection gracefully.
         """
-        dead_connections = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except WebSocketDisconnect:
-                dead_connections.append(connection)
-            except Exception as e:
-                logger.error(f"Failed to send message to a client: {e}")
-                dead_connections.append(connection)
+        payload = message.encode() if isinstance(message, str) else message
+        # Snapshot so connects/disconnects during the sends cannot mutate the set
+        connections = tuple(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_bytes(payload) for connection in connections),
+            return_exceptions=True
+        )
 
-        for connection in dead_connections:
-            self.disconnect(connection)
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                if not isinstance(result, WebSocketDisconnect):
+                    logger.error(f"Failed to send message to a client: {result}")
+                self.disconnect(connection)
@@ -17,10 +17,13 @@ const Dashboard = ({ champion, telemetry, setTelemetry }) => {
       const parsedMessage = JSON.parse(message);
       if (parsedMessage.type === 'trial_update') {
         setTelemetry(prev => [...prev, parsedMessage.data]);
-      } else {
-        // Handle global run status updates
-        setRunStatus(parsedMessage.status);
-        setCurrentRunId(parsedMessage.run_id);
+      } else if (parsedMessage.patch) {
+        // Run status updates only carry the fields that changed
+        const { run_id, patch } = parsedMessage;
+        setCurrentRunId(run_id);
+        if ('status' in patch) {
+          setRunStatus(patch.status);
+        }
       }
     });
 
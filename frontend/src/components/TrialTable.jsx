@@ -26,7 +26,9 @@ const TrialTable = ({ trials }) => {
                 <span className={`px-2 py-1 text-xs font-semibold rounded-full ${
                   trial.status === 'completed'
                     ? 'bg-green-500/20 text-green-400'
-                    : 'bg-red-500/20 text-red-400'
+                    : trial.status === 'pruned'
+                      ? 'bg-yellow-500/20 text-yellow-400'
+                      : 'bg-red-500/20 text-red-400'
                 }`}>
                   {trial.status}
                 </span>
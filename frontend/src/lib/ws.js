@@ -5,13 +5,17 @@ export const connectWebSocket = (onMessage) => {
   const host = window.location.host;
   const wsUrl = `ws://${host}/ws/telemetry`;
   const ws = new WebSocket(wsUrl);
+  // The backend sends pre-encoded UTF-8 frames as binary messages
+  ws.binaryType = 'arraybuffer';
+  const decoder = new TextDecoder();
 
   ws.onopen = () => {
     console.log('WebSocket connection established.');
   };
 
   ws.onmessage = (event) => {
-    onMessage(event.data);
+    const data = typeof event.data === 'string' ? event.data : decoder.decode(event.data);
+    onMessage(data);
   };
 
   ws.onclose = () => {